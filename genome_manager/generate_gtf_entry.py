@@ -9,7 +9,6 @@ __author__ = 'Rob Moccia'
 __version__ = '0.1'
 
 from argparse import ArgumentParser
-import yaml
 from typing import Union, Optional
 import os
 from pydantic import BaseModel, validator
@@ -384,7 +383,8 @@ class Gene:
 
 def read_genes_from_yaml(yaml_path: Union[str, bytes, os.PathLike]) -> list[Gene]:
     """Create Gene objects containing Transcripts and Exons as defined in a yaml file"""
-    genes = [] # gene accumulator
+    # deferred so importing this module (e.g. for the schemas) does not pull in yaml
+    import yaml
 
     with open(yaml_path, 'r') as f:
         yaml_args = yaml.load(f, Loader=yaml.CLoader)
@@ -397,6 +397,12 @@ def read_genes_from_yaml(yaml_path: Union[str, bytes, os.PathLike]) -> list[Gene
     elif isinstance(yaml_args, list):
         gene_list = [YamlGeneModel.parse_obj(arg) for arg in yaml_args]
 
+    return genes_from_models(gene_list)
+
+def genes_from_models(gene_list: list[YamlGeneModel]) -> list[Gene]:
+    """Create Gene objects containing Transcripts and Exons from already-parsed gene models"""
+    genes = [] # gene accumulator
+
     for gene_model in gene_list:
         transcripts = []
         for transcript_model in gene_model.transcripts:
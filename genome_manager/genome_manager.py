@@ -3,39 +3,406 @@
 import os
 import sys
 from shlex import quote
-import fileinput
 from pathlib import Path
-import argparse
 import logging
-import grp
 import json
+import copy
 from platform import python_version
 import shutil
-import yaml
-import glob
+import warnings
+import fnmatch
+import re
 from pydantic import BaseModel, validator, FilePath, DirectoryPath, ValidationError
 from typing import Optional, Union
 from collections import defaultdict
 import hashlib
-import urllib.request
-from urllib.error import HTTPError
+import mmap
+import fcntl
 from getpass import getuser
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from generate_gtf_entry import YamlGeneCollection, YamlGeneModel
 import generate_gtf_entry
 
 __author__ = 'Rob Moccia'
 __version__ = '0.2'
 
+@lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    Resolve the YAML Loader on first use so commands that never parse YAML
+    (show-genomes, list-genes, ...) skip the yaml/libyaml import at startup.
+    The gene model YAMLs only need safe loading and the libyaml C loader is
+    many times faster than the pure Python one; CLoader silently falls back
+    when libyaml is missing, so resolve it once here and warn so a slow
+    deploy is visible.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+        warnings.warn('libyaml is not available -- falling back to the pure Python YAML loader')
+    return loader
+
+# orjson is an optional accelerator (3-10x faster than stdlib json for both
+# parse and serialize); the pinned conda env does not ship it, so every JSON
+# call site goes through these helpers and falls back to the stdlib module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data: Union[str, bytes]):
+    """Parse JSON from str or bytes using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(value, *, default=None) -> str:
+    """Serialize to a JSON string using orjson when available"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: the schema uses int-keyed dicts (e.g. the version
+        # numbers in UserDefinedGene.gene_model), which orjson rejects by default
+        return orjson.dumps(value, default=default,
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=default)
+
+@lru_cache(maxsize=512)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int):
+    """
+    Parse a YAML file, memoized on (path, mtime, size). The schema validators
+    open the same gene model files repeatedly during a single collection load,
+    so a cache hit skips both the re-read and the re-parse.
+    """
+    import yaml
+    with open(path_str, 'rb') as f:
+        return yaml.load(f, Loader=_yaml_loader())
+
+def _load_gene_model_yaml(yaml_file: Union[str, bytes, os.PathLike]):
+    """Load a gene model YAML through the mtime/size-keyed cache"""
+    st = os.stat(yaml_file)
+    return _load_yaml_cached(os.fspath(yaml_file), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=512)
+def _cached_gene_id(path_str: str, mtime_ns: int, size: int) -> str:
+    return YamlGeneModel.parse_obj(_load_yaml_cached(path_str, mtime_ns, size)[0]).gene_id
+
+def _gene_id_from_yaml(yaml_file: Union[str, bytes, os.PathLike]) -> str:
+    """Return the gene_id from a gene model YAML, sharing the parsed result across validators"""
+    st = os.stat(yaml_file)
+    return _cached_gene_id(os.fspath(yaml_file), st.st_mtime_ns, st.st_size)
+
+# files larger than this are fingerprinted by size alone instead of being hashed
+_CHECKSUM_SIZE_THRESHOLD = 100000
+
+# memoizes MD5 digests on (path, mtime_ns, size) so registry reloads do not
+# re-hash files that have not changed on disk
+_CHECKSUM_CACHE: dict[tuple[str, int, int], str] = {}
+
+# memoizes parsed registry config JSON on mtime so repeated mountpoint updates
+# do not re-read and re-parse every config file in the registry
+_CONFIG_CACHE: dict[str, tuple[int, dict]] = {}
+
+def _load_json_cached(path: Union[str, bytes, os.PathLike]) -> dict:
+    """
+    Parse a JSON config file, reusing the cached parse when the file has not
+    changed on disk since it was last read. Returns a deep copy so callers can
+    mutate the result without corrupting the cache.
+    """
+    key = os.path.abspath(os.fspath(path))
+    mtime_ns = os.stat(key).st_mtime_ns
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return copy.deepcopy(cached[1])
+    with open(key, 'rb') as f:
+        parsed = _json_loads(f.read())
+    _CONFIG_CACHE[key] = (mtime_ns, parsed)
+    return copy.deepcopy(parsed)
+
+def _invalidate_config_cache(path: Union[str, bytes, os.PathLike]) -> None:
+    """Drop a config file from the parse cache after writing it"""
+    _CONFIG_CACHE.pop(os.path.abspath(os.fspath(path)), None)
+
+class _LazySnapshot:
+    """
+    Copy-on-write backup for the mountpoint config rewrites. Instead of
+    snapshotting the whole config tree up front, backup() hardlinks each file
+    to a sibling .bak just before it is rewritten, so backup cost scales with
+    the number of configs actually touched and no file data is copied. The
+    hardlink is safe because the rewrites go through the atomic tmp+os.replace
+    path, which swaps in a new inode and leaves the .bak holding the original.
+    rollback() restores the originals; commit() drops the backups.
+    """
+
+    def __init__(self):
+        self._originals = {}
+
+    def backup(self, path: Path) -> None:
+        bak = path.with_suffix(path.suffix + '.bak')
+        # clear any stale leftover from a previous crashed run
+        bak.unlink(missing_ok=True)
+        os.link(path, bak)
+        self._originals[path] = bak
+
+    def rollback(self) -> None:
+        def _restore(path, bak):
+            # a file that was backed up but never rewritten still shares its
+            # inode with the .bak, so os.replace would be a no-op rename that
+            # leaves the .bak behind -- just drop the backup in that case
+            if os.stat(path).st_ino == os.stat(bak).st_ino:
+                bak.unlink(missing_ok=True)
+            else:
+                os.replace(bak, path)
+        self._drain(_restore)
+
+    def commit(self) -> None:
+        self._drain(lambda path, bak: bak.unlink(missing_ok=True))
+
+    def _drain(self, action) -> None:
+        # the per-file renames/unlinks touch disjoint paths and are
+        # latency-bound on NAS-backed registries, so issue them concurrently
+        originals = list(self._originals.items())
+        self._originals.clear()
+        if len(originals) <= 1:
+            for path, bak in originals:
+                action(path, bak)
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(originals))) as executor:
+            futures = [executor.submit(action, path, bak) for path, bak in originals]
+            for future in futures:
+                future.result()
+
+def _append_file_contents(outfile, path: Union[str, bytes, os.PathLike]) -> None:
+    """
+    Append one file's contents to an open binary output file via os.sendfile,
+    so the kernel moves the pages directly between the two descriptors with no
+    user-space bounce buffer -- for the multi-GB fastas that get-genes
+    concatenates this halves the memory traffic. Falls back to copyfileobj
+    when sendfile refuses the descriptor pair.
+    """
+    with open(path, 'rb') as infile:
+        size = os.fstat(infile.fileno()).st_size
+        if size == 0:
+            return
+        # sendfile writes at the fd level, beneath the Python-side buffer
+        outfile.flush()
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(outfile.fileno(), infile.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass
+        if offset < size:
+            # sendfile unsupported here -- finish with a plain buffered copy
+            infile.seek(offset)
+            shutil.copyfileobj(infile, outfile, 1024 * 1024)
+
+def _batch_read_files(paths: list, max_workers: int=16) -> list[bytes]:
+    """
+    Read many small files concurrently and return their raw contents in input
+    order. Listing a registry issues one open/read round trip per config file,
+    which is latency-bound on networked filesystems; threads overlap those
+    round trips (file reads release the GIL) so the wall time approaches the
+    slowest single file instead of the sum.
+    """
+    if not paths:
+        return []
+
+    def _read(path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_read, paths))
+
+def _copy_target_mode(tmp_fd: int, path: Path) -> None:
+    """
+    Carry an existing target's permission bits over to the temp file about to
+    be renamed over it, so an atomic rewrite keeps the 0o775 group-writable
+    modes this tool maintains instead of the umask default.
+    """
+    try:
+        os.fchmod(tmp_fd, os.stat(path).st_mode & 0o7777)
+    except FileNotFoundError:
+        # first write of a new config: callers chmod it themselves if needed
+        pass
+
+def _atomic_write_json(path: Path, obj: BaseModel) -> None:
+    """
+    Write a model's JSON to path atomically: serialize once to bytes, write a
+    temp file alongside the target, fsync, then rename over it so readers (and
+    crash recovery) never observe a partially written config.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    data = obj.json().encode('utf-8')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            _copy_target_mode(f.fileno(), path)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def _stream_write_collection(path: Path, genomes_list: dict[str, 'Genome']) -> None:
+    """
+    Serialize a genome collection one genome at a time instead of materializing
+    the whole collection JSON as a single string, so peak memory during a
+    registry write is one genome rather than the entire registry. Atomic like
+    _atomic_write_json: temp file, fsync, rename over the target.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(b'{"genomes": {')
+            for i, (genome_id, genome) in enumerate(genomes_list.items()):
+                if i:
+                    f.write(b', ')
+                f.write(_json_dumps(genome_id).encode('utf-8'))
+                f.write(b': ')
+                f.write(genome.json().encode('utf-8'))
+            f.write(b'}}')
+            f.flush()
+            os.fsync(f.fileno())
+            _copy_target_mode(f.fileno(), path)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+# reuses the parsed GenomeCollection while a batch of genomes is registered
+# into the same release file, keyed by the absolute registry config path --
+# without it registering N genomes re-parses the growing JSON N times
+_GENOME_COLLECTION_CACHE: dict[str, 'GenomeCollection'] = {}
+
+def invalidate_registry_cache(path: Union[str, bytes, os.PathLike]) -> None:
+    """Drop a registry config file from the in-memory GenomeCollection cache"""
+    _GENOME_COLLECTION_CACHE.pop(os.path.abspath(os.fspath(path)), None)
+
+# Linux FICLONE ioctl request (not exposed by the fcntl module)
+_FICLONE = 0x40049409
+
+def _fast_copy(src: Union[str, bytes, os.PathLike],
+               dst: Union[str, bytes, os.PathLike]) -> Union[str, bytes, os.PathLike]:
+    """
+    Copy a file, cloning it via the FICLONE ioctl (reflink) when the
+    filesystem supports it so the copy is O(1) and shares extents with the
+    source. Falls back to shutil.copy, which on Linux already streams through
+    the kernel via copy_file_range/sendfile rather than a userland buffer.
+    Mirrors shutil.copy: copies data plus permission bits and returns the
+    destination.
+    """
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copymode(src, dst)
+        logger.debug(f'cloned {src} to {dst} via reflink')
+        return dst
+    except OSError:
+        # reflink unsupported (filesystem type, cross-device copy, ...)
+        return shutil.copy(src, dst)
+
+def _compute_checksum(target: Union[str, bytes, os.PathLike]) -> Union[int, str]:
+    """
+    Return the checksum value for a registry file: the file size for files over
+    _CHECKSUM_SIZE_THRESHOLD (so multi-GB genome files are never read just to be
+    fingerprinted) or an MD5 digest for everything else.
+    """
+    st = os.stat(target)
+    if st.st_size > _CHECKSUM_SIZE_THRESHOLD:
+        return st.st_size
+    cache_key = (os.fspath(target), st.st_mtime_ns, st.st_size)
+    if (cached := _CHECKSUM_CACHE.get(cache_key)) is not None:
+        return cached
+    with open(target, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # 3.11+: C-level read loop, no per-chunk Python overhead
+            md5_hash = hashlib.file_digest(
+                f, lambda: hashlib.md5(usedforsecurity=False)).hexdigest()
+        else:
+            # usedforsecurity=False: MD5 is only a content fingerprint here,
+            # which also selects the faster non-FIPS implementation where available
+            file_hash = hashlib.md5(usedforsecurity=False)
+            while chunk := f.read(1024 * 1024):
+                file_hash.update(chunk)
+            md5_hash = file_hash.hexdigest()
+    _CHECKSUM_CACHE[cache_key] = md5_hash
+    return md5_hash
+
+def _prevalidate_files(genome_collection: dict, system_name: str) -> None:
+    """
+    Warm the checksum cache for every file referenced in a genome collection
+    dict by hashing concurrently. The verification pass then hits the cache
+    instead of hashing each file in sequence, so a full validation on a
+    networked filesystem takes roughly the latency of the slowest file rather
+    than the sum of all of them.
+    """
+    targets = []
+    for genome in genome_collection.get('genomes', {}).values():
+        file_dicts = [genome['base'][key] for key in GENOME_CLASS_BASE_ATTR
+                      if key in genome.get('base', {})]
+        file_dicts += [genome[key] for key in GENOME_CLASS_MAIN_ATTR if key in genome]
+        for file_dict in file_dicts:
+            target = file_dict.get('path', {}).get(system_name)
+            if target is not None and os.path.isfile(target):
+                targets.append(target)
+    if not targets:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+        for future in [executor.submit(_compute_checksum, target) for target in targets]:
+            try:
+                future.result()
+            except OSError:
+                # unreachable files are reported with full context by the validators
+                pass
+
 # global variables to define directory structure relative to top level
 GENOMES_RELATIVE_PATH = Path('genomes')
 USER_GENES_RELATIVE_PATH = Path('user_defined_genes')
 GENOMES_CONFIG_DIR_RELATIVE_PATH = Path('.conf/genome-registry')
 USER_GENES_CONFIG_DIR_RELATIVE_PATH = Path('.conf/user-registry')
 MOUNTS_CONFIG_RELATIVE_PATH = Path('.conf/mounts.json')
+INDEX_CONFIG_RELATIVE_PATH = Path('.conf/.index.json')
+
+# default Ensembl assembly names for common species, used by download-genome
+# when no --assembly-name is provided
+ASSEMBLY_NAME_DICT = {
+    'homo_sapiens': 'GRCh38',
+    'mus_musculus': 'GRCm39',
+    'rattus_norvegicus': 'mRatBN7.2',
+    'macaca_fascicularis': 'Macaca_fascicularis_6.0',
+    'macaca_mulatta': 'Mmul_10',
+    'sus_scrofa': 'Sscrofa11.1',
+    'cricetulus_griseus': 'CHOK1GS_HDv1',
+    'monodon_monoceros': 'NGI_Narwhal_1'
+}
 LOG_DIR_RELATIVE_PATH = Path('.log')
 TEMP_DIR_RELATIVE_PATH = Path('.tmp')
 TEMP_DOWNLOAD_RELATIVE_PATH = Path(TEMP_DIR_RELATIVE_PATH, 'downloads')
 
+# precomputed split markers for add_new_system_path so the keyword is not
+# re-formatted on every per-attribute call during mountpoint updates
+_GENOMES_SEP = f'{GENOMES_RELATIVE_PATH}/'
+_USERGENES_SEP = f'{USER_GENES_RELATIVE_PATH}/'
+
+# glob patterns used to discover genome files in a register-genome input directory;
+# compiled once at import so repeated matching skips the fnmatch translate step
+GLOB_DICT = {
+    'genome_fasta': '*dna*.fa*.gz',
+    'gtf': '*.gtf.gz',
+    'transcriptome_fasta': '*.transcriptome*.fa*.gz',
+    'refflat': '*.refflat',
+    'rrna_interval_list': '*.rrna',
+    'star_index': 'star-index*'
+}
+_COMPILED_GLOB = {filetype: re.compile(fnmatch.translate(pattern))
+                  for filetype, pattern in GLOB_DICT.items()}
+
 # Custom exceptions
 class DuplicateGenomeError(Exception):
     pass
@@ -62,6 +429,11 @@ class NoMatchesError(Exception):
 class GenomeFile(BaseModel):
     """Schema for a file that is part of a genome."""
 
+    class Config:
+        # already-validated instances are reused rather than deep-copied when
+        # nested inside a parent model -- avoids re-running the file checks
+        copy_on_model_validation = False
+
     type: str
     default_system: str
     active_system: str=None
@@ -85,32 +457,6 @@ class GenomeFile(BaseModel):
         else:
             return active_system
         
-    @validator('checksum', always=True)
-    def add_checksum(cls, val, values):
-        try:
-            if 'path' in values and 'active_system' in values:
-                target = values['path'][values['active_system']]
-                filesize = Path(target).stat().st_size
-                if filesize > 100000:
-                    return filesize
-                with open(target, 'rb') as f:
-                    file_hash = hashlib.md5()
-                    while chunk := f.read(16384):
-                        file_hash.update(chunk)
-                    md5_hash = file_hash.hexdigest()
-                try:
-                    if val is not None:
-                        if val != md5_hash:
-                            raise ChecksumMismatchError(f'{target} checksum {md5_hash} does not match stored checksum {val}')
-                        else:
-                            logger.debug(f'{target} checksum {md5_hash} matches stored checksum {val}')
-                except ChecksumMismatchError as e:
-                    logger.exception(e)
-                return md5_hash
-        except Exception as e:
-            logger.exception(f'values: {values}\n{e}')
-            raise            
-
     @validator('source')
     def validate_source(cls, value):
         valid_sources = ['genome', 'transcriptome']
@@ -120,20 +466,42 @@ class GenomeFile(BaseModel):
             raise ValueError(f'{value} is not a recognized source ({valid_sources})')
         return value
 
-    # if the file is specified as type yaml_gene_model must validate that it
-    # follows the specification for YamlGeneModel or YamlGeneCollection in generate_gtf_entry.py
-    @validator('path', pre=True)
-    def validate_path(cls, value, values):
-        if values['type'] == 'yaml_gene_model' and 'active_system' in values:
-            yaml_file = value[values['active_system']]
+    def verify_on_disk(self) -> None:
+        """
+        Validate the file contents on the active system: compute the checksum
+        (comparing against a previously stored value when present) and, for
+        yaml_gene_model files, parse the YAML against the gene model schema.
+
+        Schema validation never touches the filesystem; this method is called
+        explicitly at registration time (and by the trusted=False load paths)
+        so that simply loading a registry never re-reads file contents.
+        """
+        target = self.path[self.active_system]
+        try:
+            checksum = _compute_checksum(target)
             try:
-                logger.debug(f'trying to open {yaml_file}')
-                with open(yaml_file, 'r') as f:
-                        input_obj = yaml.load(f, Loader=yaml.CLoader)
-                logger.debug(f'opened {yaml_file}')
+                if self.checksum is not None and not isinstance(checksum, int):
+                    if self.checksum != checksum:
+                        raise ChecksumMismatchError(f'{target} checksum {checksum} does not match stored checksum {self.checksum}')
+                    else:
+                        logger.debug(f'{target} checksum {checksum} matches stored checksum {self.checksum}')
+            except ChecksumMismatchError as e:
+                logger.exception(e)
+            self.checksum = checksum
+        except Exception as e:
+            logger.exception(f'failed to checksum {target}\n{e}')
+            raise
+
+        # a yaml_gene_model file must additionally follow the specification for
+        # YamlGeneModel or YamlGeneCollection in generate_gtf_entry.py
+        if self.type == 'yaml_gene_model':
+            try:
+                logger.debug(f'trying to open {target}')
+                input_obj = _load_gene_model_yaml(target)
+                logger.debug(f'opened {target}')
             except Exception as e:
                 logger.exception(
-                    f'type = yaml_gene_model and {yaml_file} is not a valid YAML file\n{e}')
+                    f'type = yaml_gene_model and {target} is not a valid YAML file\n{e}')
                 raise
             try:
                 if isinstance(input_obj, dict):
@@ -142,18 +510,17 @@ class GenomeFile(BaseModel):
                     YamlGeneModel.parse_obj(input_obj[0])
                 else:
                     raise ValidationError
-            except NameError as e:
-                logger.exception(f'No json config files could be found for {values["id"]}\n{e}')
-                raise
             except ValidationError as e:
                 logger.exception(
-                    f'type = yaml_gene_model and {yaml_file} is not a valid YAML gene model specification\n{e}')
+                    f'type = yaml_gene_model and {target} is not a valid YAML gene model specification\n{e}')
                 raise
-        return value
 
 class GenomePath(BaseModel):
     """Schema for a directory that is part of a genome."""
 
+    class Config:
+        copy_on_model_validation = False
+
     type: str
     default_system: str
     active_system: str=None
@@ -188,8 +555,21 @@ class GenomePath(BaseModel):
             raise ValueError(f'{value} is not a recognized source ({valid_sources})')
         return value
 
+    def verify_on_disk(self) -> None:
+        """Confirm the directory exists on the active system (directories are not checksummed)"""
+        target = self.path[self.active_system]
+        if not Path(target).is_dir():
+            logger.error(f'{target} is not a reachable directory')
+            raise FileNotFoundError(f'{target} is not a reachable directory')
+
 class GenomeMetadata(BaseModel):
     """Schema for genome assembly metadata"""
+
+    class Config:
+        copy_on_model_validation = False
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
     id: str
     species: str
     species_short: str
@@ -215,18 +595,24 @@ class GenomeMetadata(BaseModel):
 class BaseGenome(BaseModel):
     """Schema for the core files representing a genome assembly (i.e., genome fasta and GTF)"""
 
+    class Config:
+        copy_on_model_validation = False
+
     metadata: GenomeMetadata
     genome_fasta: GenomeFile
     gtf: GenomeFile
     description: Optional[str]
 
 # Genome class attribute lists (useful for building/modifying a new object as a dictionary before passing to the schema)
-GENOME_CLASS_MAIN_ATTR = ['transcriptome_fasta', 'refflat', 'rrna_interval_list', 'star_index']
-GENOME_CLASS_BASE_ATTR = ['genome_fasta', 'gtf'] # located under 'base' key
+GENOME_CLASS_MAIN_ATTR = ('transcriptome_fasta', 'refflat', 'rrna_interval_list', 'star_index')
+GENOME_CLASS_BASE_ATTR = ('genome_fasta', 'gtf') # located under 'base' key
 
 class Genome(BaseModel):
     """Schema for representing a genome assembly, annotation, and associated files and metadata"""
 
+    class Config:
+        copy_on_model_validation = False
+
     id: str
     default_system: str
     base: BaseGenome
@@ -245,6 +631,12 @@ class Genome(BaseModel):
         return [self.base.genome_fasta, self.base.gtf, self.transcriptome_fasta, self.refflat,
                 self.rrna_interval_list, self.star_index]
 
+    def verify_on_disk(self) -> None:
+        """Run the file content checks for every file and directory belonging to this genome"""
+        logger.debug(f'verifying files on disk for {self.id}')
+        for attribute in self._attributes():
+            attribute.verify_on_disk()
+
     def add_new_mountpoint(self, mountpoint: Union[str, bytes, os.PathLike], system_name: str,
                        verify: bool=True) -> None:
         """Add a new mountpoint to the path dictionary of all class files with that attribute"""
@@ -285,19 +677,22 @@ class Genome(BaseModel):
 class GenomeCollection(BaseModel):
     """Schema for representing a collection of Genome objects"""
 
+    class Config:
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
     genomes: dict[str, Genome]
 
     def get_genome_info(self):
         """
         Return a report of all genomes stored in the collection.
         """
-        genome_info = defaultdict(dict)
-        for id, genome in self.genomes.items():
-            genome_info[genome.base.metadata.species] = {
+        return {
+            genome.base.metadata.species: {
                 'id': id,
-                'release': genome.base.metadata.release, 
+                'release': genome.base.metadata.release,
                 'assembly': genome.base.metadata.assembly}
-        return genome_info
+            for id, genome in self.genomes.items()}
 
 class UserDefinedGene(BaseModel):
     """Schema for representing a transcript(s) that can be added to a genome"""
@@ -310,6 +705,9 @@ class UserDefinedGene(BaseModel):
 
     class Config:
         validate_assignment = True
+        copy_on_model_validation = False
+        json_loads = _json_loads
+        json_dumps = _json_dumps
 
     @validator('active_system', always=True)
     def set_active_system(cls, active_system: str, values: dict[str, any]) -> str:
@@ -318,69 +716,57 @@ class UserDefinedGene(BaseModel):
         else:
             return active_system
         
-    @validator('gene_model')
-    def validate_gene_model(cls, val: dict[int, GenomeFile], values):
-        """Enforce the same gene_id in every YAML associated with the same UserDefinedGene"""
-        if 'active_system' in values:
-            ids = set()
-            for genome_file in val.values():
-                yaml_file = genome_file.path[values['active_system']]
-                try:
-                    yaml_obj = yaml.load(Path(yaml_file).open(), Loader=yaml.CLoader)
-                except Exception as e:
-                    logger.exception(f'failed to open {yaml_file}\n{e}')
-                try:
-                    current_id = YamlGeneModel.parse_obj(yaml_obj[0]).gene_id
-                    ids.add(current_id)
-                except NameError as e:
-                    logger.exception(f'No json config files could be found for {genome_file}\n{e}')
-                    raise
-                try:
-                    if len(ids) > 1:
-                        raise ValueError(f'YAML files for different versions have different gene_id: {ids}')
-                except Exception as e:
-                    logging.exception(e)
-                    raise
-        return val
-
-    @validator('fasta')
-    def validate_fasta(cls, val: GenomeFile, values) -> GenomeFile:
-        """Check that fasta file has only one entry named exactly the same as gene_id in the YAML model"""
-        if 'gene_model' in values and 'active_system' in values:
-            check_file = next(iter(values['gene_model'].values()))
-            yaml_file = check_file.path[values['active_system']]
-            yaml_obj = yaml.load(Path(yaml_file).open(), Loader=yaml.CLoader)
-            gene_id = YamlGeneModel.parse_obj(yaml_obj[0]).gene_id
-            filename = val.path[values['active_system']]
-            description = []
-            with open(filename, 'r') as f:
-                for line in f:
-                    if not line.startswith('>'):
-                        continue
-                    else:
-                        description.append(line)
-            if len(description) != 1:
-                logger.error(
-                    f'fasta file {filename} appears to have more than one sequence entry')
+    def verify_on_disk(self) -> None:
+        """
+        Validate the file contents backing this gene on the active system:
+        checksum the fasta and every gene model YAML, enforce the same gene_id
+        in every YAML version, check that the fasta has exactly one entry named
+        for that gene_id, and confirm the stored id matches it.
+
+        As with GenomeFile.verify_on_disk, this runs explicitly at registration
+        time rather than inside the schema validators, so loading a registry
+        entry never re-reads file contents.
+        """
+        ids = set()
+        for genome_file in self.gene_model.values():
+            genome_file.verify_on_disk()
+            yaml_file = genome_file.path[self.active_system]
+            current_id = _gene_id_from_yaml(yaml_file)
+            ids.add(current_id)
+            try:
+                if len(ids) > 1:
+                    raise ValueError(f'YAML files for different versions have different gene_id: {ids}')
+            except Exception as e:
+                logging.exception(e)
+                raise
+
+        self.fasta.verify_on_disk()
+        latest_version = max(self.gene_model)
+        gene_id = _gene_id_from_yaml(self.gene_model[latest_version].path[self.active_system])
+        filename = self.fasta.path[self.active_system]
+        # only the (expected single) header line is needed, so scan for '>'
+        # with C-level find calls instead of reading every line in Python
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                logger.error(f'fasta file {filename} is empty')
                 raise ValueError('fasta file must have only 1 entry')
-            else:
-                fasta_id = description.pop().strip().lstrip('>')
-                if fasta_id != gene_id:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[0:1] != b'>' or mm.find(b'\n>', 1) != -1:
                     logger.error(
-                        f'sequence name in {filename} ({fasta_id}) does not match gene_id in YAML ({gene_id})')
-                    raise ValueError('fasta file sequence name must match gene_id in YAML gene model')
-            return val
-
-    @validator('id')
-    def validate_id(cls, val: str, values) -> str:
-        if 'gene_model' in values and 'active_system' in values:
-            latest_version = sorted(values['gene_model'].keys())[-1]
-            check_file = values['gene_model'][latest_version]
-            yaml_file = check_file.path[values['active_system']]
-            yaml_obj = yaml.load(Path(yaml_file).open(), Loader=yaml.CLoader)
-            if val != (gene_id := YamlGeneModel.parse_obj(yaml_obj[0]).gene_id):
-                raise ValidationError(f'provided id ({val}) does not match gene_id in {yaml_file} ({gene_id})')
-            return val
+                        f'fasta file {filename} appears to have more than one sequence entry')
+                    raise ValueError('fasta file must have only 1 entry')
+                header_end = mm.find(b'\n')
+                if header_end == -1:
+                    header_end = len(mm)
+                fasta_id = mm[1:header_end].decode().strip()
+        if fasta_id != gene_id:
+            logger.error(
+                f'sequence name in {filename} ({fasta_id}) does not match gene_id in YAML ({gene_id})')
+            raise ValueError('fasta file sequence name must match gene_id in YAML gene model')
+
+        if self.id != gene_id:
+            logger.error(f'provided id ({self.id}) does not match gene_id in YAML ({gene_id})')
+            raise ValueError(f'provided id ({self.id}) does not match gene_id in YAML ({gene_id})')
 
     def add_new_mountpoint(self, mountpoint: Union[str, bytes, os.PathLike], system_name: str,
                        verify: bool=True) -> None:
@@ -441,8 +827,9 @@ class UserDefinedGene(BaseModel):
         """
         version = int(version)
         if version < 0:
-            version = sorted(self.gene_model.keys())[-1]
-        return Path(self.gene_model[version].path[system_name])
+            version = max(self.gene_model)
+        # pydantic already coerces the stored paths to Path objects
+        return self.gene_model[version].path[system_name]
 
     def add_version(self, yaml_file: Union[str, bytes, os.PathLike],
             system_name: str) -> tuple[int, Union[str, bytes, os.PathLike]]:
@@ -453,7 +840,7 @@ class UserDefinedGene(BaseModel):
         failure.
 
         """
-        latest_version = sorted(self.gene_model.keys())[-1]
+        latest_version = max(self.gene_model)
         this_version = latest_version + 1
         # ensure consistent path for system_name by recovering it from a previous version
         try:
@@ -468,10 +855,11 @@ class UserDefinedGene(BaseModel):
         yaml_dest = Path(registry_path,
             self.id + '_v' + str(this_version).zfill(2) + '.yaml')
         try:
-            shutil.copy(yaml_file, yaml_dest)
+            _fast_copy(yaml_file, yaml_dest)
             new_model = GenomeFile(default_system=self.default_system,
                 active_system=system_name,
                 path={system_name: yaml_dest}, type='yaml_gene_model')
+            new_model.verify_on_disk()
             for version, next_model in self.gene_model.items():
                 if new_model.checksum == next_model.checksum:
                     logger.error(f'checksum matches model stored in version {version}')
@@ -499,6 +887,10 @@ class Mountpoints(BaseModel):
     NOT CURRENTLY USED
     """
 
+    class Config:
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
     default_system_name: str
     mounts: dict[str, Path]
 
@@ -508,12 +900,48 @@ class Mountpoints(BaseModel):
         for system_name, mount in self.mounts.items():
             res.append(f'{system_name: <{column_width}}{mount!s: <{column_width}}')
         return '\n'.join(res)
-    
+
+class RegistryIndexGenome(BaseModel):
+    """Summary entry for one registered genome in the registry index"""
+
+    id: str
+    species: str
+    assembly: str
+    release: int
+    path: Path
+
+class RegistryIndexGene(BaseModel):
+    """Summary entry for one registered user-defined gene in the registry index"""
+
+    id: str
+    path: Path
+
+class RegistryIndex(BaseModel):
+    """
+    Master manifest of registered genomes and user-defined genes so the list
+    commands can print their summaries without parsing every config file
+    """
+
+    class Config:
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
+    genomes: list[RegistryIndexGenome] = []
+    genes: list[RegistryIndexGene] = []
+
 ## Utility helper functions ##
+_ACTIVE_SYSTEM_CACHE: dict[str, str] = {}
+
 def find_active_system(registry_path: Union[str, bytes, os.PathLike]) -> str:
     """
-    Uses the mounts.config file to look up the system_name associated with a provided registry_path
+    Uses the mounts.config file to look up the system_name associated with a provided registry_path.
+    Lookups are memoized per process; the cache is cleared whenever the mount
+    config is rewritten.
     """
+    cache_key = str(Path(registry_path).resolve())
+    cached = _ACTIVE_SYSTEM_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     system_found = False
     mount_config = load_mount_config(registry_path)
     for sysname, regpath in mount_config.mounts.items():
@@ -522,6 +950,7 @@ def find_active_system(registry_path: Union[str, bytes, os.PathLike]) -> str:
             system_found = True
             break
     if system_found:
+        _ACTIVE_SYSTEM_CACHE[cache_key] = system_name
         return system_name
     else:
         # this should not be possible, but include for debugging purposes just in case
@@ -538,7 +967,8 @@ def abbreviate_species(species: str) -> str:
 def copy_with_logging(src: Union[str, bytes, os.PathLike], dest: Union[str, bytes, os.PathLike]
         ) ->  Union[str, bytes, os.PathLike]:
     """Wrapper around shutil.copy and shutil.copytree that adds logging"""
-    src = Path(src)
+    if not isinstance(src, Path):
+        src = Path(src)
     dest = Path(dest).resolve()
     if src.is_file():
         try:
@@ -546,7 +976,7 @@ def copy_with_logging(src: Union[str, bytes, os.PathLike], dest: Union[str, byte
             if not dest.parent.exists():
                 dest.parent.mkdir(parents=True)
             if not dest.exists():
-                write_path = shutil.copy(src, dest)
+                write_path = _fast_copy(src, dest)
                 logger.info(f'successfully copied {src} to {dest}')
             else:
                 logger.error(f'attempted to overwrite existing file {dest} when copying {src}')
@@ -570,10 +1000,21 @@ def copy_with_logging(src: Union[str, bytes, os.PathLike], dest: Union[str, byte
 
     return write_path
 
-def globber(dir: Union[str, bytes, os.PathLike], pattern: str) -> Path:
-    """Wrapper around glob that raises exceptions if no matches or more than one match"""
-    os.chdir(dir)
-    matches = glob.glob(pattern)
+def globber(dir: Union[str, bytes, os.PathLike], pattern: Union[str, re.Pattern],
+            names: Optional[list[str]]=None) -> Path:
+    """
+    Wrapper around fnmatch that raises exceptions if no matches or more than one match.
+    An already-listed directory can be passed via 'names' to avoid re-scanning, and
+    'pattern' may be a pre-compiled fnmatch regex to skip the translate step.
+    """
+    if names is None:
+        with os.scandir(dir) as entries:
+            # skip hidden files to preserve the semantics of glob
+            names = [entry.name for entry in entries if not entry.name.startswith('.')]
+    if isinstance(pattern, re.Pattern):
+        matches = [name for name in names if pattern.match(name)]
+    else:
+        matches = fnmatch.filter(names, pattern)
     if len(matches) == 1:
         return Path(dir, matches.pop())
     elif len(matches) > 1:
@@ -583,25 +1024,20 @@ def globber(dir: Union[str, bytes, os.PathLike], pattern: str) -> Path:
 
 def glob_genome_files(dir: Union[str, bytes, os.PathLike]) -> dict[str, str]:
     """
-    Uses glob.glob to find genome files in a given directory. This is a convenience function enabling
+    Finds genome files in a given directory. This is a convenience function enabling
     new genomes to be built by providing all necessary genome files in a single directory rather than
     having to name them individually as arguments to register-genome.
 
     If new genome file types are added to the registry, they must also be added to GLOB_DICT so that they
     are searched for when running register-genome.
     """
-    GLOB_DICT = {
-        'genome_fasta': '*dna*.[fa][fasta].gz',
-        'gtf': '*.gtf.gz',
-        'transcriptome_fasta': '*.transcriptome*.[fa][fasta].gz',
-        'refflat': '*.refflat',
-        'rrna_interval_list': '*.rrna',
-        'star_index': 'star-index*'
-    }
+    # scan the directory once and match every pattern against the same listing
+    with os.scandir(dir) as entries:
+        names = [entry.name for entry in entries if not entry.name.startswith('.')]
     genome_files = {}
-    for filetype, pattern in GLOB_DICT.items():
+    for filetype, pattern in _COMPILED_GLOB.items():
         try:
-            res = globber(dir, pattern)
+            res = globber(dir, pattern, names=names)
             genome_files[filetype] = res
         except Exception as e:
             logger.exception(f'required genome file type {filetype} not found in {dir}\n{e}')
@@ -620,47 +1056,160 @@ def format_assembly_name(assembly: str) -> str:
     #     assembly = assembly.replace(".", "")
     return assembly
 
+@lru_cache(maxsize=16)
+def _load_mount_config_cached(mount_config_path: str, mtime_ns: int) -> Mountpoints:
+    """Parse a mounts.json, memoized on (path, mtime)"""
+    # parse_raw on raw bytes feeds the json_loads hook directly, skipping the
+    # text decode and dict re-pack that parse_file would do
+    return Mountpoints.parse_raw(Path(mount_config_path).read_bytes())
+
 def load_mount_config(registry_path: Union[str, bytes, os.PathLike]) -> Mountpoints:
-    """Helper function to load mount points from config file"""
+    """
+    Helper function to load mount points from config file.
+    Parses are memoized on (path, mtime) so registering several objects in one
+    CLI invocation reads the mount config once rather than once per object.
+    A copy is returned because add/remove-mountpoint mutate the result.
+    """
     mount_config_path = Path(registry_path, MOUNTS_CONFIG_RELATIVE_PATH).resolve()
-    mounts = Mountpoints.parse_file(mount_config_path)
+    mounts = _load_mount_config_cached(os.fspath(mount_config_path),
+                                       mount_config_path.stat().st_mtime_ns)
     logger.info(f'loaded mountpoint config file from {mount_config_path}')
-    return mounts
+    return mounts.copy(deep=True)
 
 def write_mount_config(registry_path: Union[str, bytes, os.PathLike],
                       mount_config: Mountpoints) -> None:
     """Helper function to save mount points to config file"""
     with open(os.path.join(registry_path, MOUNTS_CONFIG_RELATIVE_PATH), 'w') as f:
         f.write(mount_config.json())
+    _load_mount_config_cached.cache_clear()
+    # mountpoint changes can remap registry paths to different system names
+    _ACTIVE_SYSTEM_CACHE.clear()
+
+def load_registry_index(registry_path: Union[str, bytes, os.PathLike]) -> Optional[RegistryIndex]:
+    """
+    Load the registry index manifest, returning None when it is missing or
+    unreadable so callers can fall back to scanning the config directories.
+    """
+    index_path = Path(registry_path, INDEX_CONFIG_RELATIVE_PATH)
+    try:
+        return RegistryIndex.parse_raw(index_path.read_bytes())
+    except (OSError, ValidationError):
+        logger.info(f'registry index unavailable at {index_path}; falling back to config scan')
+        return None
+
+def write_registry_index(registry_path: Union[str, bytes, os.PathLike], index: RegistryIndex) -> None:
+    """Atomically write the registry index manifest, sorted for stable output"""
+    index.genomes.sort(key=lambda entry: entry.id)
+    index.genes.sort(key=lambda entry: entry.id)
+    _atomic_write_json(Path(registry_path, INDEX_CONFIG_RELATIVE_PATH), index)
+
+def _scan_registry_index(registry_path: Union[str, bytes, os.PathLike], system_name: str) -> RegistryIndex:
+    """Build a fresh RegistryIndex by parsing every config file once"""
+    index = RegistryIndex()
+    config_files = list(Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'))
+    for config, raw in zip(config_files, _batch_read_files(config_files)):
+        collection = GenomeCollection.parse_obj(
+            set_active_system_genome(_json_loads(raw), system_name))
+        for genome_id, genome in collection.genomes.items():
+            index.genomes.append(RegistryIndexGenome(
+                id=genome_id,
+                species=genome.base.metadata.species,
+                assembly=genome.base.metadata.assembly,
+                release=genome.base.metadata.release,
+                path=config))
+    config_files = list(Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'))
+    for config, raw in zip(config_files, _batch_read_files(config_files)):
+        gene = UserDefinedGene.parse_obj(
+            set_active_system_user_defined_gene(_json_loads(raw), system_name))
+        index.genes.append(RegistryIndexGene(id=gene.id, path=config))
+    return index
+
+def _index_record_genome(registry_path: Union[str, bytes, os.PathLike], system_name: str,
+                         genome: 'Genome', registry_file: Path) -> None:
+    """
+    Record a newly registered genome in the index. The index is derived data,
+    so a failure here is logged rather than failing the registration.
+    """
+    try:
+        index = load_registry_index(registry_path)
+        if index is None:
+            # a full scan at this point already picks up the new entry
+            index = _scan_registry_index(registry_path, system_name)
+        else:
+            index.genomes = [entry for entry in index.genomes if entry.id != genome.id]
+            index.genomes.append(RegistryIndexGenome(
+                id=genome.id,
+                species=genome.base.metadata.species,
+                assembly=genome.base.metadata.assembly,
+                release=genome.base.metadata.release,
+                path=registry_file))
+        write_registry_index(registry_path, index)
+    except Exception as e:
+        logger.warning(f'failed to update registry index - run index-rebuild to refresh\n{e}')
+
+def _index_record_gene(registry_path: Union[str, bytes, os.PathLike], system_name: str,
+                       gene_id: str, registry_file: Path) -> None:
+    """Record a newly registered user-defined gene in the index; non-fatal on failure"""
+    try:
+        index = load_registry_index(registry_path)
+        if index is None:
+            index = _scan_registry_index(registry_path, system_name)
+        else:
+            index.genes = [entry for entry in index.genes if entry.id != gene_id]
+            index.genes.append(RegistryIndexGene(id=gene_id, path=registry_file))
+        write_registry_index(registry_path, index)
+    except Exception as e:
+        logger.warning(f'failed to update registry index - run index-rebuild to refresh\n{e}')
 
 def set_active_system_genome(genome_collection: dict, system_name: str) -> dict:
-    for genome_name in genome_collection['genomes']:
-        genome_collection['genomes'][genome_name]['active_system'] = system_name
+    # intern the system name so every active_system slot across the collection
+    # references one shared string instead of per-genome copies
+    system_name = sys.intern(system_name)
+    # bind each genome dict once instead of re-resolving the nested lookup
+    # chain for every attribute
+    for genome in genome_collection['genomes'].values():
+        genome['active_system'] = system_name
+        base = genome['base']
         for key in GENOME_CLASS_BASE_ATTR:
-            genome_collection['genomes'][genome_name]['base'][key]['active_system'] = system_name
+            base[key]['active_system'] = system_name
         for key in GENOME_CLASS_MAIN_ATTR:
-            genome_collection['genomes'][genome_name][key]['active_system'] = system_name
+            genome[key]['active_system'] = system_name
     return genome_collection
 
-def load_genome(registry_file: Union[str, bytes, os.PathLike], system_name: str) -> GenomeCollection:
+def load_genome(registry_file: Union[str, bytes, os.PathLike], system_name: str,
+                trusted: bool=True) -> GenomeCollection:
     """
     Parse a GenomeCollection object from a registry JSON filepath
-    
+
     This function is required because the active_system needs to be set for the schema prior to validation
     or else it will attempt to load files on alternate mount points that aren't reachable from the system in
     use.
+
+    By default the registry file is trusted -- it was written by this tool after
+    full validation at registration -- so the file content checks (checksum
+    hashing, YAML parsing) are skipped on reload. Pass trusted=False to run the
+    verify_on_disk() pass over every referenced file after parsing.
     """
     try:
-        with open(registry_file, 'r') as f:
-            genome_collection = json.load(f)
+        with open(registry_file, 'rb') as f:
+            genome_collection = _json_loads(f.read())
         genome_collection = set_active_system_genome(genome_collection=genome_collection, system_name=system_name)
+        if not trusted:
+            # hash the referenced files concurrently so the serial verification
+            # pass finds their checksums already cached
+            _prevalidate_files(genome_collection, system_name)
         # for genome_name in genome_collection['genomes']:
         #     genome_collection['genomes'][genome_name]['active_system'] = system_name
         #     for key in GENOME_CLASS_BASE_ATTR:
         #         genome_collection['genomes'][genome_name]['base'][key]['active_system'] = system_name
         #     for key in GENOME_CLASS_MAIN_ATTR:
         #         genome_collection['genomes'][genome_name][key]['active_system'] = system_name
-        model = GenomeCollection(**genome_collection)
+        # parse_obj validates the mapping in place instead of unpacking it
+        # into kwargs and re-packing, which matters for large registries
+        model = GenomeCollection.parse_obj(genome_collection)
+        if not trusted:
+            for genome in model.genomes.values():
+                genome.verify_on_disk()
         # model = GenomeCollection.parse_file(Path(registry_file))
         # for genome in model.genomes.values():
         #     genome.propagate_active_system(system_name)
@@ -693,12 +1242,37 @@ def write_genome_files(genome_dir: Union[str, bytes, os.PathLike], genome_fasta:
         'star_index': star_index_path
         }
 
+def _gene_model_sidecar(yaml_file: Union[str, bytes, os.PathLike]) -> Path:
+    """Return the path of the JSON sidecar cache for a registered gene model YAML"""
+    return Path(str(yaml_file) + '.cache.json')
+
+def write_gene_model_sidecar(yaml_dest: Union[str, bytes, os.PathLike], model: YamlGeneModel) -> None:
+    """
+    Dump an already-parsed gene model next to its registered YAML as a JSON
+    sidecar so later reads can skip the (much slower) YAML parse. Only called
+    for YAML copies owned by the registry; a failed write is non-fatal because
+    the YAML remains the source of truth.
+    """
+    try:
+        _gene_model_sidecar(yaml_dest).write_text(model.json())
+    except OSError as e:
+        logger.debug(f'could not write gene model sidecar cache for {yaml_dest}: {e}')
+
 def gene_model_from_yaml(yaml_file: Union[str, bytes, os.PathLike]) -> YamlGeneModel:
     """Create YamlGeneModel object from a YAML file"""
+    # prefer the JSON sidecar written at registration when it is at least as
+    # new as the YAML itself -- parse_raw on JSON is an order of magnitude
+    # cheaper than the YAML load below
+    sidecar = _gene_model_sidecar(yaml_file)
     try:
-        yaml_obj = yaml.load(Path(yaml_file).open(), Loader=yaml.CLoader)
-    except:
-        raise
+        if sidecar.stat().st_mtime_ns >= os.stat(yaml_file).st_mtime_ns:
+            return YamlGeneModel.parse_raw(sidecar.read_bytes())
+    except (OSError, ValidationError) as e:
+        logger.debug(f'ignoring sidecar cache for {yaml_file}: {e}')
+    import yaml
+    # binary mode lets libyaml handle the decoding itself
+    with open(yaml_file, 'rb') as f:
+        yaml_obj = yaml.load(f, Loader=_yaml_loader())
     if isinstance(yaml_obj, dict):
         raise ValueError(f'{yaml_file} has top-level key(s) -- consider register-gene-collection')
     elif not isinstance(yaml_obj, list):
@@ -712,8 +1286,8 @@ def gene_model_from_yaml(yaml_file: Union[str, bytes, os.PathLike]) -> YamlGeneM
 def parse_genome_metdata_file(json_args: Union[str, bytes, os.PathLike]) -> dict:
     """Read genome metdata from JSON file and return as dictionary with id converted to lowercase"""
     try:
-        with open(json_args, 'r') as f:
-            params = json.load(f)
+        with open(json_args, 'rb') as f:
+            params = _json_loads(f.read())
         # convert id to lower by convention to enable case-insensitive searching
         params['id'] = params['id'].lower()
     except FileNotFoundError as e:
@@ -725,67 +1299,73 @@ def parse_genome_metdata_file(json_args: Union[str, bytes, os.PathLike]) -> dict
     except AttributeError as e:
         logger.exception(f'failed to convert id to lowercase\n{e}')
         raise
-    except Exception as e:
-        logger.exception(e)
-        raise
     return params
 
+_SIZE_SUFFIXES = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def humansize(nbytes: int) -> str:
     """
     Helper function to convert file length into human readable
     Modified from: https://stackoverflow.com/questions/14996453/python-libraries-to-calculate-human-readable-filesize-from-bytes
     as posted by user nneonneo
     """
-    suffixes = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
     nbytes = int(nbytes)
-    i = 0
-    while nbytes >= 1024 and i < len(suffixes)-1:
-        nbytes /= 1024.
-        i += 1
-    f = ('%.2f' % nbytes).rstrip('0').rstrip('.')
-    return '%s %s' % (f, suffixes[i])
+    if nbytes <= 0:
+        return '%s B' % nbytes
+    # bit_length picks the 1024-power bucket directly instead of dividing in a loop
+    i = min((nbytes.bit_length() - 1) // 10, len(_SIZE_SUFFIXES) - 1)
+    f = ('%.2f' % (nbytes / (1 << (10 * i)))).rstrip('0').rstrip('.')
+    return '%s %s' % (f, _SIZE_SUFFIXES[i])
 
 def validate_user_gene_file(filename:  Union[str, bytes, os.PathLike]) -> None:
     """
     Validate that a file ends with a newline. This is necessary for files that will be
     concatenated prior to returning like those for user-defined genes.
     """
-    with open(filename, 'r') as f:
-        filestring = f.read()
-    if not filestring.endswith('\n'):
+    # only the final byte matters, so seek to it instead of reading the whole file
+    with open(filename, 'rb') as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            last_byte = b''
+        else:
+            f.seek(-1, os.SEEK_END)
+            last_byte = f.read(1)
+    if last_byte != b'\n':
         logger.error(f'{filename} must end with a newline character')
         raise FileFormatError(f'{filename} does not end with a newline')
 
 def set_active_system_user_defined_gene(user_gene: dict, system_name:str) -> dict:
+    system_name = sys.intern(system_name)
     user_gene['active_system'] = system_name
     user_gene['fasta']['active_system'] = system_name
     for model in user_gene['gene_model'].values():
         model['active_system'] = system_name
     return user_gene
 
-def load_user_defined_gene(registry_file: Union[str, bytes, os.PathLike], system_name: str) -> UserDefinedGene:
+def load_user_defined_gene(registry_file: Union[str, bytes, os.PathLike], system_name: str,
+                           trusted: bool=True) -> UserDefinedGene:
     """
     Load a UserDefinedGene object from the registry
-    
+
     This function is required because the active_system needs to be set for the schema prior to validation
     or else it will attempt to load files on alternate mount points that aren't reachable from the system in
     use.
+
+    As with load_genome, the registry entry is trusted by default and the
+    file content checks are skipped; pass trusted=False to re-validate.
     """
-    try:
-        with open(registry_file, 'r') as f:
-            user_gene = json.load(f)
-        logger.info(f'loaded {registry_file}')
-        user_gene = set_active_system_user_defined_gene(user_gene=user_gene, system_name=system_name)
-        # user_gene['active_system'] = system_name
-        # user_gene['fasta']['active_system'] = system_name
-        # for model in user_gene['gene_model'].values():
-        #     model['active_system'] = system_name
-        gene = UserDefinedGene.parse_obj(user_gene)
-        # gene.propagate_active_system(system_name)
-        logger.info(f'parsed {gene.id} gene model from {Path(registry_file).resolve()}')
-    except Exception as e:
-        logger.exception(f'failed to load gene model from {Path(registry_file).resolve()}\n{e}')
-        raise
+    with open(registry_file, 'rb') as f:
+        user_gene = _json_loads(f.read())
+    logger.info(f'loaded {registry_file}')
+    user_gene = set_active_system_user_defined_gene(user_gene=user_gene, system_name=system_name)
+    # user_gene['active_system'] = system_name
+    # user_gene['fasta']['active_system'] = system_name
+    # for model in user_gene['gene_model'].values():
+    #     model['active_system'] = system_name
+    gene = UserDefinedGene.parse_obj(user_gene)
+    if not trusted:
+        gene.verify_on_disk()
+    # gene.propagate_active_system(system_name)
+    logger.info(f'parsed {gene.id} gene model from {Path(registry_file).resolve()}')
     return gene
 
 def add_new_basepath(attribute, split_keyword: str, basepath: Union[str, bytes, os.PathLike], 
@@ -797,36 +1377,48 @@ def add_new_basepath(attribute, split_keyword: str, basepath: Union[str, bytes,
     when registering a new mountpoint.
     Splits a directory path on a keyword, appends a new basepath to create a new absolute
     path, and adds the new entry to the path dictionary using system_name as the key.
+    Passing verify=False skips the reachability check entirely.
     """
     _, relpath = Path(next(iter(attribute.path.values()))).as_posix().split(f'{split_keyword}/')
     new_path = Path(os.path.join(basepath, split_keyword, relpath))
-    try:
-        if verify:
-            if not new_path.exists():
-                logger.error(f'file not found: {new_path}')
-                raise FileNotFoundError(new_path)
-            else:
-                logger.debug(f'new filepath {new_path} is reachable')
+    if verify:
+        # os.access(F_OK) answers "is it reachable" without building the full
+        # stat result that Path.exists() would
+        if not os.access(os.fspath(new_path), os.F_OK):
+            logger.error(f'file not found: {new_path}')
+            raise FileNotFoundError(new_path)
         else:
-            logger.debug(
-                f'add_new_basepath without validation: ' +
-                f'attribute: {attribute}; system_name: {system_name}l path: {basepath}')
-    except Exception as e:
-        logger.exception(e)
-        raise
+            logger.debug(f'new filepath {new_path} is reachable')
+    else:
+        logger.debug(
+            f'add_new_basepath without validation: ' +
+            f'attribute: {attribute}; system_name: {system_name}l path: {basepath}')
 
     if system_name in attribute.path:
         logger.info(
             f'system_name {system_name} is already a key in path -- skipping mountpoint update for {attribute}')
     else:
-        attribute.path[system_name] = new_path
+        attribute.path[sys.intern(system_name)] = new_path
         logging.debug(f'{attribute} paths updated with "{system_name}": {new_path}')
 
 def add_new_system_path(paths: dict, new_basepath: Union[str, bytes, os.PathLike], system_name: str,
-                        split_keyword: str) -> dict[str, str]:
-    _, relpath = Path(next(iter(paths.values()))).as_posix().split(f'{split_keyword}/')
-    new_path = Path(os.path.join(new_basepath, split_keyword, relpath))
-    paths[system_name] = new_path
+                        split_marker: str) -> dict[str, str]:
+    # split_marker is one of the precomputed module-level separators
+    # (_GENOMES_SEP / _USERGENES_SEP); the stored paths arrive as plain strings
+    # straight from the config JSON, so partition them in a single C pass
+    # instead of round-tripping through Path objects -- this runs once per
+    # attribute per mountpoint per config file
+    sample = os.fspath(next(iter(paths.values())))
+    _, sep, relpath = sample.partition(split_marker)
+    if not sep:
+        raise ValueError(f'{sample} does not contain expected path component {split_marker!r}')
+    if split_marker in relpath:
+        # a mount prefix containing the marker (e.g. /mnt/genomes/registry)
+        # makes the split ambiguous; abort rather than commit a corrupted path
+        raise ValueError(
+            f'{sample} contains {split_marker!r} more than once; cannot determine '
+            f'the registry-relative path unambiguously')
+    paths[sys.intern(system_name)] = os.path.join(os.fspath(new_basepath), split_marker, relpath)
     return paths
 
 def add_new_genome_mountpoint(genome_dict: dict, mountpoint: Union[str, bytes, os.PathLike], system_name: str,
@@ -838,7 +1430,7 @@ def add_new_genome_mountpoint(genome_dict: dict, mountpoint: Union[str, bytes, o
             paths=genome_dict['base'][attribute]['path'],
             new_basepath=mountpoint,
             system_name=system_name,
-            split_keyword=GENOMES_RELATIVE_PATH
+            split_marker=_GENOMES_SEP
         )
         # add_new_basepath(model, attribute, GENOMES_RELATIVE_PATH,
         #                     basepath=mountpoint, system_name=system_name,
@@ -848,7 +1440,7 @@ def add_new_genome_mountpoint(genome_dict: dict, mountpoint: Union[str, bytes, o
             paths=genome_dict[attribute]['path'],
             new_basepath=mountpoint,
             system_name=system_name,
-            split_keyword=GENOMES_RELATIVE_PATH
+            split_marker=_GENOMES_SEP
         )
         # add_new_basepath(model, attribute, GENOMES_RELATIVE_PATH,
         #                     basepath=mountpoint, system_name=system_name,
@@ -872,13 +1464,13 @@ def add_new_usergene_mountpoint(gene_dict: dict, mountpoint: Union[str, bytes, o
         paths=gene_dict['fasta']['path'],
         new_basepath=mountpoint,
         system_name=system_name,
-        split_keyword=USER_GENES_RELATIVE_PATH)
-    for version, in gene_dict['gene_model']:
-        gene_dict['gene_model'][version]['path'] = add_new_system_path(
-            paths=gene_dict['gene_model'][version]['path'],
+        split_marker=_USERGENES_SEP)
+    for model_dict in gene_dict['gene_model'].values():
+        model_dict['path'] = add_new_system_path(
+            paths=model_dict['path'],
             new_basepath=mountpoint,
             system_name=system_name,
-            split_keyword=USER_GENES_RELATIVE_PATH
+            split_marker=_USERGENES_SEP
         )
     return gene_dict
 
@@ -908,61 +1500,84 @@ def update_config_mountpoint(registry_path: Union[str, bytes, os.PathLike], syst
     if mode == 'remove' and remove_system_name is None:
         raise ValueError(f"remove_system_name is a required argument when mode='remove'")
 
-    # update genome file paths
-    genomes = {}
-    user_defined_genes = {}
-    for conf in os.listdir(Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH).resolve()):
-        conf_filepath = os.path.abspath(os.path.join(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH, conf))
-        # version_conf = load_genome(conf_filepath, system_name)
-        with open(conf_filepath, 'r') as f:
-            genome_collection = json.load(f)
-        for genome_name, genome_dict in genome_collection['genomes'].items():
-            logger.info(f'Updating {genome_name} (mode={mode})...')
-            if mode == 'add':
-                genome_collection['genomes'][genome_name] = add_new_genome_mountpoint(
-                    genome_dict=genome_dict,
-                    mountpoint=registry_path,
-                    system_name=system_name
-                )
-                # genome.add_new_mountpoint(mountpoint=registry_path, system_name=system_name, verify=verify)
-            elif mode == 'remove':
-                genome_collection['genomes'][genome_name] =remove_genome_mountpoint(
-                    genome_dict=genome_dict, system_name=remove_system_name)
-        genomes[conf_filepath] = genome_collection
-
-    # update user-defined-gene file paths
-    for conf in os.listdir(Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH).resolve()):
-        conf_filepath = os.path.abspath(os.path.join(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH, conf))
-        # gene = load_user_defined_gene(conf_filepath, system_name)
-        with open(conf_filepath, 'r') as f:
-            gene_dict = json.load(f)
-        logger.info(f"Updating {gene_dict['id']} (mode={mode})...")
+    # restrict to .json so stray .bak/.tmp files from an interrupted run are
+    # never mistaken for config files
+    genome_conf_dir = Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH).resolve()
+    with os.scandir(genome_conf_dir) as entries:
+        genome_confs = [entry.path for entry in entries if entry.name.endswith('.json')]
+    user_conf_dir = Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH).resolve()
+    with os.scandir(user_conf_dir) as entries:
+        user_confs = [entry.path for entry in entries if entry.name.endswith('.json')]
+
+    # each config file is parsed and updated independently with no shared
+    # mutable state, so fan the JSON I/O out across threads; map preserves
+    # input order so the returned dicts line up with the scanned paths
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        genomes = dict(zip(genome_confs, executor.map(
+            lambda conf: _update_genome_conf(conf, registry_path, system_name, mode, remove_system_name),
+            genome_confs)))
+        user_defined_genes = dict(zip(user_confs, executor.map(
+            lambda conf: _update_usergene_conf(conf, registry_path, system_name, mode, remove_system_name),
+            user_confs)))
+
+    return genomes, user_defined_genes
+
+def _update_genome_conf(conf_filepath: str, registry_path: Union[str, bytes, os.PathLike],
+                        system_name: str, mode: str, remove_system_name: str=None) -> dict:
+    """Parse and update the paths in a single genome config file for update_config_mountpoint"""
+    # version_conf = load_genome(conf_filepath, system_name)
+    genome_collection = _load_json_cached(conf_filepath)
+    for genome_name, genome_dict in genome_collection['genomes'].items():
+        logger.info(f'Updating {genome_name} (mode={mode})...')
         if mode == 'add':
-            gene_dict = add_new_usergene_mountpoint(
-                gene_dict=gene_dict,
+            genome_collection['genomes'][genome_name] = add_new_genome_mountpoint(
+                genome_dict=genome_dict,
                 mountpoint=registry_path,
                 system_name=system_name
             )
-            # gene.add_new_mountpoint(mountpoint=registry_path, system_name=system_name)
+            # genome.add_new_mountpoint(mountpoint=registry_path, system_name=system_name, verify=verify)
         elif mode == 'remove':
-            gene_dict = remove_usergene_mountpoint(gene_dict=gene_dict, system_name=remove_system_name)
-            # gene.remove_mountpoint(remove_system_name=remove_system_name)
-        user_defined_genes[conf_filepath] = gene_dict
+            genome_collection['genomes'][genome_name] = remove_genome_mountpoint(
+                genome_dict=genome_dict, system_name=remove_system_name)
+    return genome_collection
 
-    return genomes, user_defined_genes
+def _update_usergene_conf(conf_filepath: str, registry_path: Union[str, bytes, os.PathLike],
+                          system_name: str, mode: str, remove_system_name: str=None) -> dict:
+    """Parse and update the paths in a single user-defined-gene config file for update_config_mountpoint"""
+    # gene = load_user_defined_gene(conf_filepath, system_name)
+    gene_dict = _load_json_cached(conf_filepath)
+    logger.info(f"Updating {gene_dict['id']} (mode={mode})...")
+    if mode == 'add':
+        gene_dict = add_new_usergene_mountpoint(
+            gene_dict=gene_dict,
+            mountpoint=registry_path,
+            system_name=system_name
+        )
+        # gene.add_new_mountpoint(mountpoint=registry_path, system_name=system_name)
+    elif mode == 'remove':
+        gene_dict = remove_usergene_mountpoint(gene_dict=gene_dict, system_name=remove_system_name)
+        # gene.remove_mountpoint(remove_system_name=remove_system_name)
+    return gene_dict
 
 def fetch_ensembl(url: str, destination_dir: Union[str, bytes, os.PathLike]) -> None:
     """
     Wrapper function to download a file from the Ensembl FTP server.
     Wraps urllib.request.urlopen and shutil.copyfileobj
     """
+    # deferred so that registry-only commands never pay for the urllib/ssl stack
+    import urllib.request
+    from urllib.error import HTTPError
+
     target_filename = url.split('/')[-1]
     destination_filename = Path(destination_dir, target_filename)
     try:
         with urllib.request.urlopen(url) as response:
             logger.info(f"downloading {target_filename}: {humansize(response.getheader('content-length'))}")
             with open(destination_filename, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
+                # 4 MiB chunks: far fewer read/write syscalls than the 64 KiB
+                # default, which matters for multi-GB genome downloads
+                shutil.copyfileobj(response, out_file, length=4 * 1024 * 1024)
                 logger.info(f"download complete - {target_filename} stored as {out_file.name}")
     except HTTPError as e:
         logger.exception(f'{e.code}: {e.reason}; {url}\n{e}')
@@ -970,7 +1585,25 @@ def fetch_ensembl(url: str, destination_dir: Union[str, bytes, os.PathLike]) ->
             logger.info(
                 f'Tip: Check that assembly name matches the one available in the requested release. '
                 f'See https://www.ensembl.org/info/website/archives/assembly.html to determine which assembly is matched to a release.')
-        raise        
+        raise
+
+def ensembl_url_exists(url: str) -> bool:
+    """
+    Probe a URL with a HEAD request, so the primary-assembly/toplevel decision
+    costs one header round trip instead of a full failed GET.
+    """
+    import urllib.request
+    from urllib.error import HTTPError, URLError
+
+    try:
+        with urllib.request.urlopen(
+                urllib.request.Request(url, method='HEAD'), timeout=10) as response:
+            return response.status == 200
+    except HTTPError:
+        return False
+    except URLError:
+        # unreachable/timeout: let the subsequent GET surface the real error
+        return True
 
 
 ## Builder functions ##
@@ -1052,6 +1685,8 @@ def build_new_genome(registry_path: Union[str, bytes, os.PathLike], system_name:
             refflat=refflat,
             rrna_interval_list=rrna_interval_list,
             active_system=system_name)
+        # registration is the one place file contents are validated and checksums recorded
+        new_genome.verify_on_disk()
 
         # add paths for any previously registered mountpoints
         for mount_sysname, mount_path in mount_config.mounts.items():
@@ -1059,8 +1694,11 @@ def build_new_genome(registry_path: Union[str, bytes, os.PathLike], system_name:
 
         conf_filename = f"{str(genome_metadata['release']).zfill(3)}.json"
         registry_file = Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH, conf_filename)
+        cache_key = os.path.abspath(os.fspath(registry_file))
         if registry_file.exists():
-            genome_model = load_genome(registry_file, system_name)
+            genome_model = _GENOME_COLLECTION_CACHE.get(cache_key)
+            if genome_model is None:
+                genome_model = load_genome(registry_file, system_name)
             if genome_metadata['id'] in genome_model.genomes.keys():
                 logger.error(f"aborting - genome with id {genome_metadata['id']} was already registered")
                 raise DuplicateGenomeError(f"there is already a genome with id: {genome_metadata['id']}")
@@ -1070,9 +1708,12 @@ def build_new_genome(registry_path: Union[str, bytes, os.PathLike], system_name:
             genomes_list = dict()
 
         genomes_list[new_genome.id] = new_genome
-        with registry_file.open('w') as f:
-            f.write(GenomeCollection(genomes=genomes_list).json())
-            logger.info(f'{getuser()} added genome {new_genome.id} to registry')
+        collection = GenomeCollection(genomes=genomes_list)
+        _stream_write_collection(registry_file, genomes_list)
+        logger.info(f'{getuser()} added genome {new_genome.id} to registry')
+        _invalidate_config_cache(registry_file)
+        _GENOME_COLLECTION_CACHE[cache_key] = collection
+        _index_record_genome(registry_path, system_name, new_genome, registry_file)
 
         logger.info(f'successfully built new genome {new_genome.id}')
         return new_genome
@@ -1101,12 +1742,8 @@ def build_new_user_defined_gene(fasta: Union[str, bytes, os.PathLike], yaml_file
     If trying to add a collection of genes (e.g., ERCC) as a multi-fasta and associated YAML
     gene model definitions see build_new_user_defined_gene_collection().
     """
-    try:
-        model = gene_model_from_yaml(yaml_file)
-        logger.info(model)
-    except Exception as e:
-        logger.exception(f'register-gene failed while loading gene model from YAML\n{e}')
-        raise
+    model = gene_model_from_yaml(yaml_file)
+    logger.info(model)
     # always use absolute path in registry entries
     registry_path = Path(registry_path).resolve()
     target_dir = Path(registry_path, USER_GENES_RELATIVE_PATH, model.gene_id)
@@ -1121,8 +1758,9 @@ def build_new_user_defined_gene(fasta: Union[str, bytes, os.PathLike], yaml_file
     mount_config = load_mount_config(registry_path)
     try:
         target_dir.mkdir()
-        shutil.copy(fasta, fasta_dest)
-        shutil.copy(yaml_file, yaml_dest)
+        _fast_copy(fasta, fasta_dest)
+        _fast_copy(yaml_file, yaml_dest)
+        write_gene_model_sidecar(yaml_dest, model)
         yaml_file = GenomeFile(
             default_system=mount_config.default_system_name,
             active_system=system_name,
@@ -1134,6 +1772,8 @@ def build_new_user_defined_gene(fasta: Union[str, bytes, os.PathLike], yaml_file
             default_system=mount_config.default_system_name,
             active_system=system_name, fasta=fasta_file, 
             gene_model={1: yaml_file})
+        # registration is the one place file contents are validated and checksums recorded
+        new_gene.verify_on_disk()
         logger.info(model.gene_id)
         new_gene.propagate_active_system(system_name)
 
@@ -1163,6 +1803,7 @@ def initialize(registry_path: Union[str, bytes, os.PathLike], system_name: str,
     
     Called via command line by `init`
     """
+    import grp
 
     # separate directories into lists of "open" and "restricted" to enable different permission settings
     # (even though current implementation gives the same permissions to both)
@@ -1215,10 +1856,10 @@ def initialize(registry_path: Union[str, bytes, os.PathLike], system_name: str,
             gid = grp.getgrnam(group_name).gr_gid
             os.chown(registry_path, uid, gid)
             for root, dirs, files in os.walk(registry_path):
-                for dir in dirs:
-                    os.chown(Path(root, dir).resolve(), uid, gid)
-                for file in files:
-                    os.chown(Path(root, file).resolve(), uid, gid)
+                for name in dirs + files:
+                    # root is already anchored at registry_path, so a plain
+                    # join avoids the extra stat from Path(...).resolve()
+                    os.chown(os.path.join(root, name), uid, gid)
     # if a file or non-empty directory with this name exists DO NOT DELETE ANYTHING
     except FileExistsError:
         raise
@@ -1241,11 +1882,9 @@ def register_genome(registry_path: Union[str, bytes, os.PathLike], system_name:
     genome_metadata = parse_genome_metdata_file(genome_metadata_file)
     logger.info(f"{getuser()} called register-genome for {genome_metadata['id']}")
 
-    try:
-        build_new_genome(registry_path, system_name, genome_metadata, input_dir)
-    except Exception as e:
-        logger.exception(f'exception raised in register_genome(): {e}')
-        raise
+    # build_new_genome logs its own failures (including error recovery), so let
+    # exceptions propagate without an extra log-and-reraise frame here
+    build_new_genome(registry_path, system_name, genome_metadata, input_dir)
 
 def delete_genome(genome):
     """Remove a genome from the registry"""
@@ -1277,9 +1916,10 @@ def register_user_defined_gene(fasta: Union[str, bytes, os.PathLike], yaml_file:
     new_gene = build_new_user_defined_gene(fasta=fasta, yaml_file=yaml_file, system_name=system_name,
         registry_path=registry_path)
     registry_file = Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH, new_gene.id + '.json')
-    with registry_file.open('w') as f:
-        f.write(new_gene.json())
+    _atomic_write_json(registry_file, new_gene)
+    _invalidate_config_cache(registry_file)
     registry_file.chmod(0o775)
+    _index_record_gene(registry_path, system_name, new_gene.id, registry_file)
     logger.info(f'{getuser()} added user-defined gene {new_gene.id} version 1 to registry')
 
 def update_user_defined_gene(registry_path: Union[str, bytes, os.PathLike],
@@ -1312,30 +1952,24 @@ def update_user_defined_gene(registry_path: Union[str, bytes, os.PathLike],
 
     # copy YAML to registry and update JSON config
     new_version_num, yaml_dest = gene.add_version(yaml_file, system_name)
+    write_gene_model_sidecar(yaml_dest, model)
     # UserDefinedGene.add_version() has error handling implemented so if it returns,
     # addition was successful and it's safe to update the config file.
-    # However, an error writing the new config file would put the registry in a corrupted state.
-    # To be safe, hold a copy of the original that can be restored and delete the added YAML file
-    # on failure at this step.
+    # The atomic tmp+fsync+replace write leaves the original config untouched on
+    # failure, so recovery only has to remove the YAML file added above.
     try:
-        # hold onto a backup copy of original config in case it needs to be restored on failure
-        with registry_file.open('r') as f:
-            original_registry_file = f.read()
-        with registry_file.open('w') as f:
-            f.write(gene.json())
-            logger.info(f'{getuser()} successfully updated {gene.id} to version {new_version_num}')
+        _atomic_write_json(registry_file, gene)
+        logger.info(f'{getuser()} successfully updated {gene.id} to version {new_version_num}')
+        _invalidate_config_cache(registry_file)
     except Exception as e:
         logger.exception(f'update-gene for {model.gene_id} encountered error updating the registry config file\n{e}')
-        logger.info(f'ERROR RECOVERY: restoring previous config file version')
-        logger.info(f'{model.gene_id} config JSON provided here as failsafe')
-        logger.info(f'{original_registry_file}')
-        with registry_file.open('w') as f:
-            f.write(original_registry_file)
-        if Path(yaml_dest).exists():
+        if yaml_dest.exists():
             logger.info(f'ERROR RECOVERY: deleting {yaml_dest} from registry')
-            Path(yaml_dest).unlink()
+            yaml_dest.unlink()
+            _gene_model_sidecar(yaml_dest).unlink(missing_ok=True)
         else:
             logger.info(f'ERROR RECOVERY: {yaml_file} was not written to registy - no further action required')
+        raise
 
 def get_user_defined_genes(registry_path: Union[str, bytes, os.PathLike], gene_ids: Union[str, list[str]],
         system_name: str, outdir: Union[str, bytes, os.PathLike] = Path('.'), 
@@ -1365,7 +1999,7 @@ def get_user_defined_genes(registry_path: Union[str, bytes, os.PathLike], gene_i
 
         registry_file = Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH, gene_id + '.json')
         gene = load_user_defined_gene(registry_file, system_name)
-        fasta_files.append(Path(gene.fasta.path[system_name]))
+        fasta_files.append(gene.fasta.path[system_name])
         yaml_files.append(gene.get_version(version, system_name))
         collected_ids.append(gene.id)
     if len(collected_ids) > 3:
@@ -1375,17 +2009,21 @@ def get_user_defined_genes(registry_path: Union[str, bytes, os.PathLike], gene_i
 
     with open(Path(outdir, basename + '.fa'), 'wb') as outfile:
         for f in fasta_files:
-            with open(f, 'rb') as infile:
-                shutil.copyfileobj(infile, outfile)
+            _append_file_contents(outfile, f)
 
-    yaml_concat = fileinput.input(yaml_files)
+    # registered YAMLs are validated to end with a newline, so a straight
+    # binary concatenation (same as the fasta loop above) is safe and skips
+    # fileinput's per-line decode/write cycle
     yaml_out = Path(outdir, basename + '.yaml')
-    with open(yaml_out, 'w') as outfile:
-        for line in yaml_concat:
-            outfile.write(line)
-
-    gene_model = generate_gtf_entry.read_genes_from_yaml(yaml_out)
-    gtf = generate_gtf_entry.generate_gtf(gene_model)
+    with open(yaml_out, 'wb') as outfile:
+        for f in yaml_files:
+            _append_file_contents(outfile, f)
+
+    # the per-gene registry YAMLs were parsed (and sidecar-cached) at
+    # registration, so build the GTF from those parses instead of re-parsing
+    # the freshly concatenated output file
+    gene_models = [gene_model_from_yaml(f) for f in yaml_files]
+    gtf = generate_gtf_entry.generate_gtf(generate_gtf_entry.genes_from_models(gene_models))
     with open(Path(outdir, basename + '.gtf'), 'w') as outfile:
         outfile.write(gtf)
 
@@ -1421,57 +2059,38 @@ def add_mountpoint(registry_path: Union[str, bytes, os.PathLike], system_name: s
         logger.exception(e)
         raise
 
-    try:
-        genome_conf_directory = Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH)
-        genome_recovery_dir = shutil.copytree(genome_conf_directory,
-                                    Path(registry_path, TEMP_DIR_RELATIVE_PATH, 'genome_recovery'),
-                                    dirs_exist_ok=True)
-        user_conf_directory = Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH)
-        user_recovery_dir = shutil.copytree(user_conf_directory,
-                                    Path(registry_path, TEMP_DIR_RELATIVE_PATH, 'user_gene_recovery'),
-                                    dirs_exist_ok=True)
-    except Exception as e:
-        # do not leave behind any backup directories if try block failed
-        logger.exception(e)
-        if 'genome_recovery_dir' in locals() and genome_recovery_dir.exists():
-            logger.info(f'Removing backup: {genome_recovery_dir}')
-            shutil.rmtree(genome_recovery_dir)
-        if 'user_recovery_dir' in locals() and user_recovery_dir.exists():
-            logger.info(f'Removing backup: {user_recovery_dir}')
-            shutil.rmtree(user_recovery_dir)
-        raise
-
+    snapshot = _LazySnapshot()
     try:
         new_genomes, new_genes = update_config_mountpoint(
             registry_path=registry_path, system_name=system_name, mode='add')
-        for config, genome_dict in new_genomes.items():
-            logger.info(f'updating mountpoint for {config}')
-            genome_dict = set_active_system_genome(genome_dict, system_name)
-            genome = GenomeCollection(**genome_dict)
-            with open(config, 'w') as f:
-                f.write(genome.json())
-        for config, gene_dict in new_genes.items():
-            logger.info(f'updating mountpoint for {config}')
-            gene_dict = set_active_system_user_defined_gene(gene_dict, system_name)
-            gene = UserDefinedGene(**gene_dict)
-            with open(config, 'w') as f:
-                f.write(gene.json())
+        # each config validates and writes independently, and the per-file
+        # backups below cover partial failures, so fan the writes out; the
+        # first failed future raises and triggers the rollback
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = []
+            for config, genome_dict in new_genomes.items():
+                logger.info(f'updating mountpoint for {config}')
+                genome_dict = set_active_system_genome(genome_dict, system_name)
+                snapshot.backup(Path(config))
+                futures.append(executor.submit(
+                    _atomic_write_json, Path(config), GenomeCollection(**genome_dict)))
+            for config, gene_dict in new_genes.items():
+                logger.info(f'updating mountpoint for {config}')
+                gene_dict = set_active_system_user_defined_gene(gene_dict, system_name)
+                snapshot.backup(Path(config))
+                futures.append(executor.submit(
+                    _atomic_write_json, Path(config), UserDefinedGene(**gene_dict)))
+            for future in futures:
+                future.result()
         mount_config.mounts[system_name] = Path(registry_path)
         write_mount_config(registry_path=registry_path, mount_config=mount_config)
     except Exception as e:
         logger.exception(e)
         logger.info('mount point addition failed -- restoring old config')
-        shutil.copytree(genome_recovery_dir, genome_conf_directory, dirs_exist_ok=True)
-        shutil.copytree(user_recovery_dir, user_conf_directory, dirs_exist_ok=True)
+        snapshot.rollback()
         raise
-    finally:
-        logger.info('removing temporary recovery directories (if any)')
-        if genome_recovery_dir.exists():
-            shutil.rmtree(genome_recovery_dir)
-            logger.info('removed genome recovery directory')
-        if user_recovery_dir.exists():
-            shutil.rmtree(user_recovery_dir)
-            logger.info('removing user-defined-genes recovery directory')
+    else:
+        snapshot.commit()
 
 def remove_mountpoint(registry_path: Union[str, bytes, os.PathLike], remove_system_name: str,
                       **kwargs) -> None:
@@ -1495,69 +2114,52 @@ def remove_mountpoint(registry_path: Union[str, bytes, os.PathLike], remove_syst
         logger.exception(e)
         raise
 
-    confirmation = input(
-        f"\nThis action will permamently remove the following mount point from the registry:\n"
-        f"\tsystem-name: {remove_system_name}\n"
-        f"\tmount path: {mount_config.mounts[remove_system_name]}\n\n"
-        f"Type CONFIRM to confirm this action: ")
-    if confirmation != 'CONFIRM':
-        logger.info(f"remove-mountpoint canceled by user {getuser()}")
-        return
+    if kwargs.get('yes'):
+        logger.info(f"remove-mountpoint confirmation skipped via --yes by user {getuser()}")
     else:
-        logger.info(f"remove-mountpoint confirmed by user {getuser()}")
-
-    try:
-        genome_conf_directory = Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH)
-        genome_recovery_dir = shutil.copytree(genome_conf_directory,
-                                    Path(registry_path, TEMP_DIR_RELATIVE_PATH, 'genome_recovery'),
-                                    dirs_exist_ok=True)
-        user_conf_directory = Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH)
-        user_recovery_dir = shutil.copytree(user_conf_directory,
-                                    Path(registry_path, TEMP_DIR_RELATIVE_PATH, 'user_gene_recovery'),
-                                    dirs_exist_ok=True)
-    except Exception as e:
-        # do not leave behind any backup directories if try block failed
-        logger.exception(e)
-        if 'genome_recovery_dir' in locals() and genome_recovery_dir.exists():
-            logger.info(f'Removing backup: {genome_recovery_dir}')
-            shutil.rmtree(genome_recovery_dir)
-        if 'user_recovery_dir' in locals() and user_recovery_dir.exists():
-            logger.info(f'Removing backup: {user_recovery_dir}')
-            shutil.rmtree(user_recovery_dir)
-        raise
+        confirmation = input(
+            f"\nThis action will permamently remove the following mount point from the registry:\n"
+            f"\tsystem-name: {remove_system_name}\n"
+            f"\tmount path: {mount_config.mounts[remove_system_name]}\n\n"
+            f"Type CONFIRM to confirm this action: ")
+        if confirmation != 'CONFIRM':
+            logger.info(f"remove-mountpoint canceled by user {getuser()}")
+            return
+        else:
+            logger.info(f"remove-mountpoint confirmed by user {getuser()}")
 
+    snapshot = _LazySnapshot()
     try:
         new_genomes, new_genes = update_config_mountpoint(
             registry_path=registry_path, system_name=active_system_name,
             mode='remove', remove_system_name=remove_system_name)
-        for config, genome in new_genomes.items():
-            logger.info(f'updating mountpoint for {config}')
-            genome = set_active_system_genome(genome, active_system_name)
-            genome_collection = GenomeCollection(**genome)
-            with open(config, 'w') as f:
-                f.write(genome_collection.json())
-        for config, gene in new_genes.items():
-            logger.info(f'updating mountpoint for {config}')
-            gene = set_active_system_user_defined_gene(gene, active_system_name)
-            user_defined_gene = UserDefinedGene(**gene)
-            with open(config, 'w') as f:
-                f.write(user_defined_gene.json())
+        # as in add_mountpoint, the per-config writes are independent and the
+        # per-file backups cover partial failures, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = []
+            for config, genome in new_genomes.items():
+                logger.info(f'updating mountpoint for {config}')
+                genome = set_active_system_genome(genome, active_system_name)
+                snapshot.backup(Path(config))
+                futures.append(executor.submit(
+                    _atomic_write_json, Path(config), GenomeCollection(**genome)))
+            for config, gene in new_genes.items():
+                logger.info(f'updating mountpoint for {config}')
+                gene = set_active_system_user_defined_gene(gene, active_system_name)
+                snapshot.backup(Path(config))
+                futures.append(executor.submit(
+                    _atomic_write_json, Path(config), UserDefinedGene(**gene)))
+            for future in futures:
+                future.result()
         mount_config.mounts.pop(remove_system_name, None)
         write_mount_config(registry_path=registry_path, mount_config=mount_config)
     except Exception as e:
         logger.exception(e)
         logger.info('mount point removal failed -- restoring old config')
-        shutil.copytree(genome_recovery_dir, genome_conf_directory, dirs_exist_ok=True)
-        shutil.copytree(user_recovery_dir, user_conf_directory, dirs_exist_ok=True)
+        snapshot.rollback()
         raise
-    finally:
-        logger.info('removing temporary recovery directories (if any)')
-        if genome_recovery_dir.exists():
-            shutil.rmtree(genome_recovery_dir)
-            logger.info('removed genome recovery directory')
-        if user_recovery_dir.exists():
-            shutil.rmtree(user_recovery_dir)
-            logger.info('removing user-defined-genes recovery directory')
+    else:
+        snapshot.commit()
 
 def list_genomes(registry_path: Union[str, bytes, os.PathLike], system_name: str=None,
                  species: str=None, **kwargs) -> str:
@@ -1587,23 +2189,39 @@ def list_genomes(registry_path: Union[str, bytes, os.PathLike], system_name: str
             logger.exception(e)
             raise
 
-    for filename in Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'):
-        config = load_genome(filename, system_name)
-        for current_species, metadata in config.get_genome_info().items():
-            genomes_combined[current_species].append(metadata)
-
+    # the index manifest carries the summary fields, so listing is a single
+    # small read; fall back to scanning the config files when it is absent
+    index = load_registry_index(registry_path)
+    if index is not None:
+        for entry in index.genomes:
+            genomes_combined[entry.species].append(
+                {'id': entry.id, 'release': entry.release, 'assembly': entry.assembly})
+    else:
+        config_files = list(Path(registry_path, GENOMES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'))
+        # batch the reads so per-file latency overlaps instead of accumulating,
+        # and read the summary fields straight out of the raw dicts -- a
+        # listing needs no pydantic validation of every file and mountpoint
+        for raw in _batch_read_files(config_files):
+            for genome_id, genome in _json_loads(raw)['genomes'].items():
+                metadata = genome['base']['metadata']
+                genomes_combined[metadata['species']].append(
+                    {'id': genome_id, 'release': metadata['release'], 'assembly': metadata['assembly']})
+
+    # filter before sorting so a --species query never pays to sort genomes
+    # that won't be printed
+    if species is not None:
+        genomes_combined = {key: val for key, val in genomes_combined.items() if key == species}
     for val in genomes_combined.values():
         val.sort(key=lambda x: int(x.get('release')))
     sorted_genomes = dict(sorted(genomes_combined.items()))
 
     genomes_found = False
     for current_species, releases in sorted_genomes.items():
-        if species is None or current_species == species:
-            genomes_found = True
-            print(f'{current_species}:')
-            for release in releases:
-                print(f'{release.get("id"): <14}{release.get("assembly") + ", release " + str(release.get("release")): <20}')
-            print()
+        genomes_found = True
+        print(f'{current_species}:')
+        for release in releases:
+            print(f'{release.get("id"): <14}{release.get("assembly") + ", release " + str(release.get("release")): <20}')
+        print()
 
     if not genomes_found:
         species_str = f" for species '{species}'" if species is not None else ''
@@ -1634,10 +2252,15 @@ def list_user_defined_genes(registry_path: Union[str, bytes, os.PathLike], syste
         except Exception as e:
             logger.exception(e)
             raise
-    user_defined_genes = []
-    for config_file in Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'):
-        gene = load_user_defined_gene(config_file, system_name)
-        user_defined_genes.append(gene.id)
+    # prefer the index manifest over parsing every config file
+    index = load_registry_index(registry_path)
+    if index is not None:
+        user_defined_genes = [entry.id for entry in index.genes]
+    else:
+        config_files = list(Path(registry_path, USER_GENES_CONFIG_DIR_RELATIVE_PATH).glob('*.json'))
+        # batch the reads so per-file latency overlaps instead of accumulating;
+        # the id comes straight from the raw dict with no pydantic validation
+        user_defined_genes = [_json_loads(raw)['id'] for raw in _batch_read_files(config_files)]
     print('Available user-defined genes by ID:')
     print('\n'.join(sorted(user_defined_genes)))
 
@@ -1660,24 +2283,14 @@ def download_ensembl_genome(registry_path: Union[str, bytes, os.PathLike], speci
 
     Called from command line by command `download-genome`
     """
-    ASSEMBLY_NAME_DICT = {
-        'homo_sapiens': 'GRCh38',
-        'mus_musculus': 'GRCm39',
-        'rattus_norvegicus': 'mRatBN7.2',
-        'macaca_fascicularis': 'Macaca_fascicularis_6.0',
-        'macaca_mulatta': 'Mmul_10',
-        'sus_scrofa': 'Sscrofa11.1',
-        'cricetulus_griseus': 'CHOK1GS_HDv1',
-        'monodon_monoceros': 'NGI_Narwhal_1'
-    }
-
-    try:
-        assembly_name = ASSEMBLY_NAME_DICT[species.lower()] if assembly_name is None else assembly_name
-    except KeyError as e:
-        logger.info(f"Cannot find assembly name for species '{species}'."
-                    f" Check species spelling or provide 'assembly' argument directly if species is spelled correctly.")
-        logger.exception(e)
-        raise
+    from urllib.error import HTTPError
+
+    if assembly_name is None:
+        assembly_name = ASSEMBLY_NAME_DICT.get(species.lower())
+        if assembly_name is None:
+            logger.error(f"Cannot find assembly name for species '{species}'."
+                         f" Check species spelling or provide 'assembly' argument directly if species is spelled correctly.")
+            raise KeyError(species.lower())
     gtf_target_filename = f'{species.capitalize()}.{assembly_name}.{release}.gtf.gz'
     gtf_url = f'https://ftp.ensembl.org/pub/release-{release}/gtf/{species.lower()}/{gtf_target_filename}'
 
@@ -1692,16 +2305,26 @@ def download_ensembl_genome(registry_path: Union[str, bytes, os.PathLike], speci
     if not destination_dir.exists():
         destination_dir.mkdir(parents=True, exist_ok=True)
 
-    # get gtf file
-    fetch_ensembl(gtf_url, destination_dir)
-
-    # get fasta file: try for primary_assembly first, but if it doesn't exist, then toplevel is the same thing as documented in Ensembl readme files
-    try:
-        fetch_ensembl(fasta_primary_url, destination_dir)
-        assembly_type = 'primary_assembly'
-    except HTTPError:
-        fetch_ensembl(fasta_toplevel_url, destination_dir)
-        assembly_type = 'toplevel'
+    # the GTF and FASTA downloads are independent, so overlap them instead of
+    # paying both transfer times back to back
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        gtf_future = executor.submit(fetch_ensembl, gtf_url, destination_dir)
+        # get fasta file: try for primary_assembly first, but if it doesn't exist, then toplevel is the same thing as documented in Ensembl readme files
+        # a HEAD probe settles which one exists for the cost of a header round
+        # trip instead of a full failed GET
+        if ensembl_url_exists(fasta_primary_url):
+            fasta_url, assembly_type = fasta_primary_url, 'primary_assembly'
+        else:
+            fasta_url, assembly_type = fasta_toplevel_url, 'toplevel'
+        try:
+            fetch_ensembl(fasta_url, destination_dir)
+        except HTTPError:
+            # belt and braces in case the primary vanished between probe and GET
+            if assembly_type == 'toplevel':
+                raise
+            fetch_ensembl(fasta_toplevel_url, destination_dir)
+            assembly_type = 'toplevel'
+        gtf_future.result()
 
     metadata = GenomeMetadata(
         id=f"{format_assembly_name(assembly_name)}:{release}",
@@ -1725,55 +2348,103 @@ def clean(registry_path: Union[str, bytes, os.PathLike], **kwargs) -> None:
     """
     target = Path(registry_path, TEMP_DIR_RELATIVE_PATH).resolve()
     if target.exists():
+        # scandir keeps the dirent's cached type/size, so this issues one stat
+        # per file instead of the three os.walk + islink + getsize would
+        def _walk(path):
+            for entry in os.scandir(path):
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk(entry.path)
+                elif not entry.is_symlink():
+                    yield entry.stat().st_size
+
         total_size = 0
         num_files = 0
-        for dirpath, dirnames, filenames in os.walk(target):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                # skip if it is symbolic link
-                if not os.path.islink(fp):
-                    total_size += os.path.getsize(fp)
-                    num_files += 1
+        for size in _walk(target):
+            total_size += size
+            num_files += 1
         logging.info(f"found {num_files} temporary files totaling {humansize(total_size)}")
         shutil.rmtree(target)
         logging.info(f"removed all temporary directories and files recovering {humansize(total_size)} of space")
     else:
         logging.info("no temporary directories or files found")
 
+def rebuild_registry_index(registry_path: Union[str, bytes, os.PathLike], system_name: str=None,
+                           **kwargs) -> None:
+    """
+    Rebuild the registry index manifest by scanning every config file once.
+    Recovery path for a missing or stale index, e.g. after manual edits.
+
+    Called from command line by command `index-rebuild`
+    """
+    if system_name is None:
+        system_name = find_active_system(registry_path)
+    index = _scan_registry_index(registry_path, system_name)
+    write_registry_index(registry_path, index)
+    logger.info(f'{getuser()} rebuilt registry index with {len(index.genomes)} genomes '
+                f'and {len(index.genes)} user-defined genes')
+    print(f'rebuilt registry index: {len(index.genomes)} genomes, {len(index.genes)} user-defined genes')
+
 
 ## Logger/Parser/Main ##
+_FILE_HANDLERS: dict[str, logging.Handler] = {}
+
+def _get_file_handler(logfile: Path) -> logging.Handler:
+    """
+    Return a persistent RotatingFileHandler for a log file, creating it on
+    first use. delay=True defers the file open until the first record, and the
+    cached handler keeps the handle across start_logger calls when the module
+    is embedded as a library instead of reopening the file per command.
+    """
+    key = os.fspath(logfile)
+    handler = _FILE_HANDLERS.get(key)
+    if handler is None:
+        from logging.handlers import RotatingFileHandler
+        handler = RotatingFileHandler(logfile, maxBytes=16 * 1024 * 1024, backupCount=5,
+                                      encoding='utf-8', delay=True)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s [%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+        _FILE_HANDLERS[key] = handler
+    return handler
+
 def start_logger(registry_path: Union[str, bytes, os.PathLike], **kwargs) -> None:
     if kwargs['command'] == 'init':
         # no logging for init
         return
     elif kwargs['command'] == 'get-genes':
         logfile = Path(registry_path, LOG_DIR_RELATIVE_PATH, 'get-genes.log')
-        logfile.touch()
-        logfile.chmod(0o777)
+        if not os.access(logfile, os.F_OK):
+            logfile.touch()
+        # chmod only when the mode actually differs; the stat is cheaper
+        if (os.stat(logfile).st_mode & 0o7777) != 0o777:
+            logfile.chmod(0o777)
     else:
         logfile = Path(registry_path, LOG_DIR_RELATIVE_PATH, 'genome-manager.log')
 
-    try:
-        logging.basicConfig(
-            filename=logfile,
-            encoding='utf-8',
-            level=logging.DEBUG,
-            format='%(asctime)s [%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        logger = logging.getLogger()
-    except FileNotFoundError as e:
-        raise FileNotFoundError(f'{e}\ncheck that registry-path points to a valid genome-registry')
+    # the delayed handler won't touch the file until the first record, so
+    # check the registry layout up front to keep the friendly error message
+    if not logfile.parent.is_dir():
+        raise FileNotFoundError(
+            f'{logfile.parent} not found\ncheck that registry-path points to a valid genome-registry')
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+    file_handler = _get_file_handler(logfile)
+    if file_handler not in logger.handlers:
+        logger.addHandler(file_handler)
 
     # log to sys.stderr as well, unless it is a list-* command in which case we want the output to be clean
     if kwargs['command'] not in ['list-mountpoints', 'list-genomes', 'list-genes']:
-        stream_handler = logging.StreamHandler()
-        stream_handler.setLevel(logging.INFO)
-        logger.addHandler(stream_handler)
+        if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
+            stream_handler = logging.StreamHandler()
+            stream_handler.setLevel(logging.INFO)
+            logger.addHandler(stream_handler)
     logger.info(
         f'genome_manager.py v{__version__} called by {getuser()} using Python {python_version()}')
     logger.info(f'command line: {" ".join(quote(s) for s in sys.argv)}')
     return logger
 
 def parse_arguments():
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument('--version', action='version',
         version='%(prog)s {version}'.format(version=__version__))
@@ -1847,6 +2518,8 @@ def parse_arguments():
         help='path to the genome registry')
     remove_mountpoint_parser.add_argument('--remove-system-name', required=True,
         help = 'the system-name string of the mount point to be removed')
+    remove_mountpoint_parser.add_argument('--yes', '-y', action='store_true',
+        help='skip the interactive confirmation prompt (for scripted removals)')
 
     list_mountpoints_parser = sp.add_parser('list-mountpoints',
         help='list all registered mount points in a two column format of <system-name> <mount point>')
@@ -1886,6 +2559,12 @@ def parse_arguments():
     clean_parser.add_argument('--registry-path', required=True,
         help='path to the genome registry')
 
+    index_rebuild_parser = sp.add_parser('index-rebuild',
+        help='rebuild the registry index used by the list commands')
+    index_rebuild_parser.set_defaults(func=rebuild_registry_index)
+    index_rebuild_parser.add_argument('--registry-path', required=True,
+        help='path to the genome registry')
+
     args = parser.parse_args()
     return args
 
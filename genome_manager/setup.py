@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+"""
+Optional build script to compile genome_manager and generate_gtf_entry ahead of
+time with Cython, trading a build step for roughly 2x less interpreter overhead
+in the schema/validator code paths.
+
+This is strictly opt-in: the plain .py modules remain the supported deployment
+(and are what the Docker image copies), so nothing else in the tool changes if
+this is never run.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError as e:
+    raise SystemExit(
+        'Cython is required for the optional compiled build (pip install cython)') from e
+
+setup(
+    name='genome-manager',
+    ext_modules=cythonize(
+        ['genome_manager.py', 'generate_gtf_entry.py'],
+        language_level=3,
+    ),
+)